@@ -0,0 +1,74 @@
+"""
+Per-user cache storage for testpy.
+
+Caches live under $XDG_CACHE_HOME/testpy (default ~/.cache/testpy), keyed by
+the absolute path they describe - never inside the repository being tested.
+Entries are plain JSON; a cache file is data only and is never executed.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Optional, Union
+
+
+def cache_dir() -> Path:
+    """
+    Get the testpy user cache directory.
+
+    Returns:
+        $XDG_CACHE_HOME/testpy, or ~/.cache/testpy when unset or relative
+    """
+    base = os.environ.get("XDG_CACHE_HOME", "")
+    if not os.path.isabs(base):
+        base = os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "testpy"
+
+
+def cache_file(kind: str, path: Union[str, Path]) -> Path:
+    """
+    Get the cache file for a kind of cached data about a path.
+
+    Args:
+        kind: Cache namespace (e.g., "spec", "pub")
+        path: File or directory the cache describes
+
+    Returns:
+        Path to the JSON cache file (may not exist)
+    """
+    digest = hashlib.sha256(os.fsencode(os.path.abspath(path))).hexdigest()[:32]
+    return cache_dir() / kind / f"{digest}.json"
+
+
+def read_json(cache_path: Path) -> Optional[Any]:
+    """Load a JSON cache file (None if missing or invalid)."""
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return None
+
+
+def write_json(cache_path: Path, data: Any) -> None:
+    """
+    Write a JSON cache file atomically.
+
+    Failures (unwritable cache dir, unserializable data) are ignored - the
+    cache is an optimization only.
+    """
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=f"{cache_path.stem}.", dir=cache_path.parent
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception:
+        pass
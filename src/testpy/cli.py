@@ -9,7 +9,9 @@ import sys
 from pathlib import Path
 
 from testpy import __version__
-from testpy.output import OutputMode, set_output_mode, print_error, info
+
+# Shared by the --version flag and main()'s fast path
+_VERSION_STRING = f"testpy {__version__}"
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -19,6 +21,8 @@ def create_parser() -> argparse.ArgumentParser:
     Returns:
         Configured ArgumentParser
     """
+    from testpy.constants import TEST_CATEGORIES
+
     parser = argparse.ArgumentParser(
         prog="testpy",
         description="Universal test orchestrator for multi-language projects",
@@ -29,15 +33,15 @@ def create_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--version",
         action="version",
-        version=f"testpy {__version__}",
+        version=_VERSION_STRING,
     )
 
     # Global options
     parser.add_argument(
         "--view",
         choices=["pretty", "data"],
-        default="pretty",
-        help="Output mode: pretty (boxy) or data (plain)",
+        default=None,
+        help="Output mode: pretty (boxy) or data (plain); default: pretty on a terminal, data otherwise",
     )
 
     parser.add_argument(
@@ -93,7 +97,7 @@ def create_parser() -> argparse.ArgumentParser:
     run_parser.add_argument(
         "category",
         nargs="?",
-        choices=["sanity", "smoke", "unit", "integration", "e2e", "uat", "chaos", "bench", "regression"],
+        choices=TEST_CATEGORIES,
         help="Test category to run (runs all if not specified)",
     )
     run_parser.add_argument(
@@ -161,9 +165,9 @@ def cmd_run(args: argparse.Namespace) -> int:
         Exit code (0=success, 1=violations, 2=test failures)
     """
     from testpy.repo import create_repo_context
-    from testpy.validator import validate_rust_tests, format_violation_report
+    from testpy.validator import validate_rust_tests
     from testpy.runner import run_rust_tests
-    from testpy.output import warning, error, success, info
+    from testpy.output import warning, error, success, info, print_error
 
     try:
         ctx = create_repo_context()
@@ -183,8 +187,10 @@ def cmd_run(args: argparse.Namespace) -> int:
                     )
                     return 1
                 else:
+                    # Counts only: the full report is never built on this path
                     warning(
-                        "Running tests despite violations (--override mode)",
+                        f"Running tests despite {violations.total()} violation(s) (--override mode)\n\n"
+                        f"Run 'testpy lint --violations' to see detailed violations report.",
                         title="⚠ Override Mode"
                     )
 
@@ -236,7 +242,7 @@ def cmd_lint(args: argparse.Namespace) -> int:
     """
     from testpy.repo import create_repo_context
     from testpy.validator import validate_rust_tests, format_violation_report, get_violation_summary
-    from testpy.output import warning, success, info
+    from testpy.output import warning, success, info, print_error
 
     try:
         ctx = create_repo_context()
@@ -307,7 +313,7 @@ def cmd_check(args: argparse.Namespace) -> int:
         Exit code (0=valid, 127=errors)
     """
     from testpy.repo import create_repo_context
-    from testpy.output import success, error
+    from testpy.output import success, error, print_error
 
     try:
         ctx = create_repo_context()
@@ -427,13 +433,21 @@ def main() -> int:
     Returns:
         Exit code (0=success, non-zero=error)
     """
+    # Fast path: answer --version without building the parser or
+    # importing the output stack
+    if sys.argv[1:] == ["--version"]:
+        print(_VERSION_STRING)
+        return 0
+
+    from testpy.output import OutputMode, set_output_mode
+
     parser = create_parser()
     args = parser.parse_args()
 
-    # Set output mode
+    # Set output mode (left on auto-detect unless chosen explicitly)
     if args.no_boxy or args.view == "data":
         set_output_mode(OutputMode.DATA)
-    else:
+    elif args.view == "pretty":
         set_output_mode(OutputMode.PRETTY)
 
     # Route to command handler
@@ -5,10 +5,11 @@ Loads and validates .spec.toml configuration files with multi-language support.
 Provides fallback chains: .spec.toml → language manifest → sensible defaults
 """
 
+import os
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, FrozenSet, List, Optional, Sequence
 
 # TOML parsing: Python 3.11+ has tomllib, older versions need tomli
 if sys.version_info >= (3, 11):
@@ -19,19 +20,129 @@ else:
     except ImportError:
         tomllib = None  # type: ignore
 
+# Optional native TOML parsers (pip install testpy[fast]).
+# Preferred over tomllib when installed: rtoml (Rust) → pytomlpp (C++).
+try:
+    import rtoml as _native_toml
+except ImportError:
+    try:
+        import pytomlpp as _native_toml
+    except ImportError:
+        _native_toml = None  # type: ignore
+
+# Supported languages
+VALID_LANGUAGES = frozenset({"rust", "python", "nodejs", "shell"})
+_VALID_LANGUAGES_STR = ", ".join(sorted(VALID_LANGUAGES))
+
+# Any of these in the repo root marks a Python project
+PYTHON_MANIFESTS = ("pyproject.toml", "setup.py", "setup.cfg")
+
+# Parsed .spec.toml cache (JSON in the user cache dir, see testpy.cache).
+# Bump the format version whenever the cached entry changes shape.
+_SPEC_CACHE_FORMAT = 3
+
+# Per-language defaults, applied to any LanguageConfig field left empty.
+# Tuples are shared and immutable - copy with list(...) before mutating.
+_LANG_DEFAULTS = {
+    "rust": {
+        "test_patterns": (
+            "tests/*.rs",
+            "tests/**/*.rs",
+        ),
+        "module_patterns": (
+            "src/*/mod.rs",      # MODULE_SPEC pattern
+            "src/*.rs",          # Legacy pattern (optional)
+        ),
+        "exclusions": (
+            "_*",
+            "dev_*",
+            "prelude*",
+            "dummy_*",
+            "lib.rs",
+            "main.rs",
+            "deps.rs",     # Hub re-exports
+            "hub.rs",      # Hub utilities/massaging
+        ),
+        "runner_cmd": "cargo test",
+    },
+    "python": {
+        "test_patterns": (
+            "tests/test_*.py",
+            "tests/*_test.py",
+            "tests/**/*_test.py",
+        ),
+        "module_patterns": (
+            "src/*/__init__.py",  # Package pattern
+            "src/*.py",           # Module pattern
+            "*/__init__.py",      # Flat layout
+            "*.py",               # Flat layout modules
+        ),
+        "exclusions": (
+            "__pycache__",
+            "*.pyc",
+            "_*",
+            "dev_*",
+            "test_*",
+            "conftest.py",
+        ),
+        "runner_cmd": "pytest",
+    },
+    "nodejs": {
+        "test_patterns": (
+            "tests/*.test.js",
+            "tests/*.spec.js",
+            "tests/**/*.test.js",
+            "__tests__/**/*.js",
+        ),
+        "module_patterns": (
+            "src/**/*.js",
+            "src/**/*.ts",
+            "lib/**/*.js",
+        ),
+        "exclusions": (
+            "node_modules",
+            "dist",
+            "build",
+            "_*",
+            "dev_*",
+            "*.test.js",
+            "*.spec.js",
+        ),
+        "runner_cmd": "npm test",
+    },
+    "shell": {
+        "test_patterns": (
+            "tests/*.sh",
+            "tests/**/*.sh",
+            "tests/sh/*.sh",
+        ),
+        "module_patterns": (
+            "bin/*.sh",
+            "scripts/*.sh",
+            "src/**/*.sh",
+        ),
+        "exclusions": (
+            "_*",
+            "dev_*",
+            "*.bak",
+        ),
+        "runner_cmd": "bash",
+    },
+}
+
 
 @dataclass
 class LanguageConfig:
     """Configuration for a specific language."""
 
     # Test file patterns for this language
-    test_patterns: List[str] = field(default_factory=list)
+    test_patterns: Sequence[str] = ()
 
     # Module file patterns for this language
-    module_patterns: List[str] = field(default_factory=list)
+    module_patterns: Sequence[str] = ()
 
     # Exclusion patterns specific to this language
-    exclusions: List[str] = field(default_factory=list)
+    exclusions: Sequence[str] = ()
 
     # Test runner command template (e.g., "cargo test", "pytest")
     runner_cmd: Optional[str] = None
@@ -64,7 +175,7 @@ class Config:
     features_root: str = "src"
 
     # Global exclusion patterns
-    exclude: List[str] = field(default_factory=list)
+    exclude: Sequence[str] = ()
 
     # Per-language configuration
     rust: LanguageConfig = field(default_factory=LanguageConfig)
@@ -80,107 +191,54 @@ class Config:
         self._apply_defaults()
 
     def _apply_defaults(self):
-        """Apply sensible defaults for each language."""
-
-        # Rust defaults
-        if not self.rust.test_patterns:
-            self.rust.test_patterns = [
-                "tests/*.rs",
-                "tests/**/*.rs",
-            ]
-        if not self.rust.module_patterns:
-            self.rust.module_patterns = [
-                "src/*/mod.rs",      # MODULE_SPEC pattern
-                "src/*.rs",          # Legacy pattern (optional)
-            ]
-        if not self.rust.exclusions:
-            self.rust.exclusions = [
-                "_*",
-                "dev_*",
-                "prelude*",
-                "dummy_*",
-                "lib.rs",
-                "main.rs",
-                "deps.rs",     # Hub re-exports
-                "hub.rs",      # Hub utilities/massaging
-            ]
-        if not self.rust.runner_cmd:
-            self.rust.runner_cmd = "cargo test"
-
-        # Python defaults
-        if not self.python.test_patterns:
-            self.python.test_patterns = [
-                "tests/test_*.py",
-                "tests/*_test.py",
-                "tests/**/*_test.py",
-            ]
-        if not self.python.module_patterns:
-            self.python.module_patterns = [
-                "src/*/__init__.py",  # Package pattern
-                "src/*.py",           # Module pattern
-                "*/__init__.py",      # Flat layout
-                "*.py",               # Flat layout modules
-            ]
-        if not self.python.exclusions:
-            self.python.exclusions = [
-                "__pycache__",
-                "*.pyc",
-                "_*",
-                "dev_*",
-                "test_*",
-                "conftest.py",
-            ]
-        if not self.python.runner_cmd:
-            self.python.runner_cmd = "pytest"
-
-        # Node.js defaults
-        if not self.nodejs.test_patterns:
-            self.nodejs.test_patterns = [
-                "tests/*.test.js",
-                "tests/*.spec.js",
-                "tests/**/*.test.js",
-                "__tests__/**/*.js",
-            ]
-        if not self.nodejs.module_patterns:
-            self.nodejs.module_patterns = [
-                "src/**/*.js",
-                "src/**/*.ts",
-                "lib/**/*.js",
-            ]
-        if not self.nodejs.exclusions:
-            self.nodejs.exclusions = [
-                "node_modules",
-                "dist",
-                "build",
-                "_*",
-                "dev_*",
-                "*.test.js",
-                "*.spec.js",
-            ]
-        if not self.nodejs.runner_cmd:
-            self.nodejs.runner_cmd = "npm test"
-
-        # Shell defaults
-        if not self.shell.test_patterns:
-            self.shell.test_patterns = [
-                "tests/*.sh",
-                "tests/**/*.sh",
-                "tests/sh/*.sh",
-            ]
-        if not self.shell.module_patterns:
-            self.shell.module_patterns = [
-                "bin/*.sh",
-                "scripts/*.sh",
-                "src/**/*.sh",
-            ]
-        if not self.shell.exclusions:
-            self.shell.exclusions = [
-                "_*",
-                "dev_*",
-                "*.bak",
-            ]
-        if not self.shell.runner_cmd:
-            self.shell.runner_cmd = "bash"
+        """Apply sensible defaults for configured languages only."""
+        for lang in self.languages:
+            self._apply_lang_defaults(lang)
+
+    def _apply_lang_defaults(self, lang: str):
+        """Fill empty fields of one language's config from _LANG_DEFAULTS."""
+        defaults = _LANG_DEFAULTS.get(lang)
+        if defaults is None:
+            return  # Unknown language (reported by validate_config)
+
+        lang_config = getattr(self, lang)
+        for key, value in defaults.items():
+            if not getattr(lang_config, key):
+                setattr(lang_config, key, value)
+
+    def language_config(self, lang: str) -> LanguageConfig:
+        """
+        Get configuration for a language, applying defaults on first use.
+
+        Defaults are only applied eagerly for languages listed in
+        config.languages; use this accessor for any other language.
+
+        Args:
+            lang: Language name ("rust", "python", "nodejs", "shell")
+
+        Returns:
+            LanguageConfig with defaults applied
+        """
+        self._apply_lang_defaults(lang)
+        return getattr(self, lang)
+
+    def exclusion_matcher(self, lang: str) -> Callable[[str], bool]:
+        """
+        Get a name matcher for a language's exclusions plus global excludes.
+
+        The matcher is specialized per pattern set and memoized, so repeated
+        calls with an unchanged config return the same function.
+
+        Args:
+            lang: Language name ("rust", "python", "nodejs", "shell")
+
+        Returns:
+            Function returning True if a name is excluded
+        """
+        from testpy.discovery import build_exclusion_matcher
+
+        patterns = tuple(self.language_config(lang).exclusions) + tuple(self.exclude)
+        return build_exclusion_matcher(patterns)
 
 
 def load_config(repo_root: Path) -> Optional[Config]:
@@ -195,16 +253,23 @@ def load_config(repo_root: Path) -> Optional[Config]:
     """
     spec_path = repo_root / ".spec.toml"
 
-    if not spec_path.exists():
+    # The stat for the cache key doubles as the existence check
+    try:
+        cache_key = _spec_cache_key(spec_path)
+    except FileNotFoundError:
         return None
 
-    if tomllib is None:
-        raise RuntimeError(
-            "TOML parsing not available. Install tomli: pip install tomli"
-        )
+    # Reuse the previously parsed TOML if .spec.toml hasn't changed
+    from testpy.cache import cache_file
 
-    with open(spec_path, "rb") as f:
-        data = tomllib.load(f)
+    cache_path = cache_file("spec", spec_path)
+    data = _read_spec_cache(cache_path, cache_key)
+    if data is None:
+        try:
+            data = load_toml(spec_path)
+        except FileNotFoundError:
+            return None  # Removed since the stat above
+        _write_spec_cache(cache_path, cache_key, data)
 
     # Check for [tests] section (new format)
     # Fallback to top-level config (legacy format)
@@ -217,7 +282,7 @@ def load_config(repo_root: Path) -> Optional[Config]:
         languages=data.get("languages", ["rust"]),
         test_root=tests_section.get("test_root", data.get("test_root", "tests")),
         features_root=data.get("features_root", "src"),
-        exclude=tests_section.get("exclude", data.get("exclude", [])),
+        exclude=tests_section.get("exclude", data.get("exclude", ())),
         source_file=spec_path,
     )
 
@@ -249,12 +314,76 @@ def load_config(repo_root: Path) -> Optional[Config]:
     return config
 
 
+def _spec_cache_key(spec_path: Path) -> list:
+    """Build cache key for .spec.toml from its path, mtime and size."""
+    st = spec_path.stat()
+    return [_SPEC_CACHE_FORMAT, os.path.abspath(spec_path), st.st_mtime_ns, st.st_size]
+
+
+def _read_spec_cache(cache_path: Path, key: list) -> Optional[Dict]:
+    """
+    Load cached .spec.toml data if the cache key still matches.
+
+    The key is checked before any cached data is used.
+
+    Args:
+        cache_path: Path to JSON cache file
+        key: Expected cache key for the current .spec.toml
+
+    Returns:
+        Parsed TOML dict on hit, None on miss or unreadable cache
+    """
+    from testpy.cache import read_json
+
+    entry = read_json(cache_path)
+    if not isinstance(entry, dict) or entry.get("key") != key:
+        return None
+
+    data = entry.get("data")
+    return data if isinstance(data, dict) else None
+
+
+def _write_spec_cache(cache_path: Path, key: list, data: Dict) -> None:
+    """Write parsed .spec.toml data to the JSON cache (failures ignored)."""
+    from testpy.cache import write_json
+
+    write_json(cache_path, {"key": key, "data": data})
+
+
+def load_toml(path: Path) -> Dict:
+    """
+    Parse a TOML file with the fastest available parser.
+
+    Native parsers (rtoml, pytomlpp) read directly from the path;
+    tomllib/tomli is used as the pure-Python fallback.
+
+    Args:
+        path: Path to TOML file
+
+    Returns:
+        Parsed TOML data as dict
+
+    Raises:
+        RuntimeError: If no TOML parser is available
+    """
+    if _native_toml is not None:
+        return _native_toml.load(path)
+
+    if tomllib is None:
+        raise RuntimeError(
+            "TOML parsing not available. Install tomli: pip install tomli"
+        )
+
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
 def _load_lang_config(data: Dict) -> LanguageConfig:
     """Load language-specific configuration from TOML data."""
     return LanguageConfig(
-        test_patterns=data.get("test_patterns", []),
-        module_patterns=data.get("module_patterns", []),
-        exclusions=data.get("exclusions", []),
+        test_patterns=data.get("test_patterns", ()),
+        module_patterns=data.get("module_patterns", ()),
+        exclusions=data.get("exclusions", ()),
         runner_cmd=data.get("runner_cmd"),
         timeout=data.get("timeout", 600),
         runner_options=data.get("runner_options", {}),
@@ -274,27 +403,44 @@ def detect_languages(repo_root: Path) -> List[str]:
         List of detected languages (e.g., ["rust", "python"])
     """
     languages = []
+    names = _root_entries(repo_root)
 
     # Rust: Cargo.toml
-    if (repo_root / "Cargo.toml").exists():
+    if "Cargo.toml" in names:
         languages.append("rust")
 
     # Python: pyproject.toml, setup.py, or setup.cfg
-    if any((repo_root / f).exists() for f in ["pyproject.toml", "setup.py", "setup.cfg"]):
+    if not names.isdisjoint(PYTHON_MANIFESTS):
         languages.append("python")
 
     # Node.js: package.json
-    if (repo_root / "package.json").exists():
+    if "package.json" in names:
         languages.append("nodejs")
 
-    # Shell: tests/ directory with .sh files
-    tests_dir = repo_root / "tests"
-    if tests_dir.exists() and list(tests_dir.glob("**/*.sh")):
+    # Shell: tests/ directory with .sh files (stop at the first match)
+    if "tests" in names and next((repo_root / "tests").rglob("*.sh"), None) is not None:
         languages.append("shell")
 
     return languages if languages else ["rust"]  # Default to Rust
 
 
+def _root_entries(repo_root: Path) -> FrozenSet[str]:
+    """
+    List entry names in the repository root with a single directory read.
+
+    Args:
+        repo_root: Repository root directory
+
+    Returns:
+        Frozenset of entry names (empty if the directory can't be read)
+    """
+    try:
+        with os.scandir(repo_root) as it:
+            return frozenset(entry.name for entry in it)
+    except OSError:
+        return frozenset()
+
+
 def create_default_config(repo_root: Path, languages: Optional[List[str]] = None) -> Config:
     """
     Create a default configuration.
@@ -329,39 +475,37 @@ def validate_config(config: Config, repo_root: Path) -> List[str]:
         List of validation errors (empty if valid)
     """
     errors = []
+    root = os.fspath(repo_root)
+    names = _root_entries(repo_root)
 
     # Validate languages
-    valid_languages = {"rust", "python", "nodejs", "shell"}
     for lang in config.languages:
-        if lang not in valid_languages:
-            errors.append(f"Invalid language: {lang}. Valid: {', '.join(valid_languages)}")
+        if lang not in VALID_LANGUAGES:
+            errors.append(f"Invalid language: {lang}. Valid: {_VALID_LANGUAGES_STR}")
 
     # Rust-specific validation
     if "rust" in config.languages:
-        if not (repo_root / "Cargo.toml").exists():
+        if "Cargo.toml" not in names:
             errors.append("Rust language configured but Cargo.toml not found")
 
     # Python-specific validation
     if "python" in config.languages:
-        manifests = ["pyproject.toml", "setup.py", "setup.cfg"]
-        if not any((repo_root / f).exists() for f in manifests):
+        if names.isdisjoint(PYTHON_MANIFESTS):
             errors.append(
-                f"Python language configured but no manifest found (need one of: {', '.join(manifests)})"
+                f"Python language configured but no manifest found (need one of: {', '.join(PYTHON_MANIFESTS)})"
             )
 
     # Node.js-specific validation
     if "nodejs" in config.languages:
-        if not (repo_root / "package.json").exists():
+        if "package.json" not in names:
             errors.append("Node.js language configured but package.json not found")
 
     # Validate test_root exists
-    test_dir = repo_root / config.test_root
-    if not test_dir.exists():
+    if not os.path.exists(os.path.join(root, config.test_root)):
         errors.append(f"Test directory not found: {config.test_root}")
 
     # Validate features_root exists
-    features_dir = repo_root / config.features_root
-    if not features_dir.exists():
+    if not os.path.exists(os.path.join(root, config.features_root)):
         errors.append(f"Features directory not found: {config.features_root}")
 
     return errors
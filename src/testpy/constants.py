@@ -0,0 +1,20 @@
+"""
+Shared constants for testpy.
+
+Kept dependency-free so the CLI parser can use them without importing
+discovery or validation modules.
+"""
+
+# Test categories in canonical order
+TEST_CATEGORIES = (
+    "sanity",
+    "smoke",
+    "unit",
+    "integration",
+    "e2e",
+    "uat",
+    "chaos",
+    "bench",
+    "regression",
+)
+VALID_CATEGORIES = frozenset(TEST_CATEGORIES)
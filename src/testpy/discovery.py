@@ -4,14 +4,41 @@ Module and test discovery for testpy.
 Language-agnostic discovery with per-language implementations.
 """
 
-from dataclasses import dataclass
+import functools
+import os
+import re
+import sys
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
-from testpy.config import Config
+from testpy.constants import TEST_CATEGORIES, VALID_CATEGORIES
 
+if TYPE_CHECKING:
+    # Annotation only - keeps config (and its TOML parser) out of the import path
+    from testpy.config import Config
 
-@dataclass
+
+# dataclass(slots=True) requires Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Root test file basename: <category> (entry) or <category>_<module>
+_CATEGORY_FILE_RE = re.compile(
+    r"(%s)(?:_(.*))?\Z" % "|".join(TEST_CATEGORIES), re.DOTALL
+)
+
+# Read size for the 'pub' keyword scan in _check_rust_public
+_PUB_SCAN_CHUNK = 65536
+
+# Minimum uncached modules before publicity scans use a thread pool
+_PUB_SCAN_PARALLEL_MIN = 4
+
+# Persistent module publicity cache kind (user cache dir, keyed by repo
+# path): {path: [mtime_ns, size, is_public]}
+_PUB_CACHE_KIND = "pub"
+
+
+@dataclass(**_SLOTS)
 class Module:
     """Discovered module information."""
 
@@ -28,7 +55,7 @@ class Module:
     is_public: bool = True
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TestFile:
     """Discovered test file information."""
 
@@ -48,7 +75,33 @@ class TestFile:
     is_category_entry: bool = False
 
 
-def discover_rust_modules(repo_root: Path, config: Config) -> List[Module]:
+@dataclass
+class TestIndex:
+    """
+    Lookup index over discovered test files.
+
+    Built once from discover_rust_tests output so (module, category)
+    queries are O(1) dict lookups instead of linear scans. Iterating the
+    index yields the underlying test list.
+    """
+
+    # All discovered tests (discovery order)
+    tests: List[TestFile] = field(default_factory=list)
+
+    # (category, module) → first matching test file
+    by_pair: Dict[Tuple[str, str], TestFile] = field(default_factory=dict)
+
+    # category → category entry file (e.g., tests/sanity.rs)
+    entries: Dict[str, TestFile] = field(default_factory=dict)
+
+    def __iter__(self) -> Iterator[TestFile]:
+        return iter(self.tests)
+
+    def __len__(self) -> int:
+        return len(self.tests)
+
+
+def discover_rust_modules(repo_root: Path, config: "Config") -> List[Module]:
     """
     Discover Rust modules from src/ directory.
 
@@ -61,61 +114,64 @@ def discover_rust_modules(repo_root: Path, config: Config) -> List[Module]:
     Returns:
         List of discovered Rust modules
     """
-    modules = []
     src_dir = repo_root / config.features_root
 
-    if not src_dir.exists():
-        return modules
+    if not src_dir.is_dir():
+        return []
 
-    # Get exclusion patterns from config
-    exclusions = config.rust.exclusions + config.exclude
+    # Exclusion matcher specialized for this config's patterns
+    is_excluded = config.exclusion_matcher("rust")
 
-    # Pattern 1: src/module/mod.rs (MODULE_SPEC standard)
-    for mod_rs in src_dir.glob("*/mod.rs"):
-        module_name = mod_rs.parent.name
+    # Single pass over src/ collecting module files (keyed by name for O(1) dedup)
+    candidates = {}
+    # legacy = {}  # Pattern 2 candidates (disabled, see below)
+    with os.scandir(src_dir) as it:
+        for entry in it:
+            module_name = entry.name
 
-        # Apply exclusion patterns
-        if _is_excluded(module_name, exclusions):
-            continue
+            # Pattern 1: src/module/mod.rs (MODULE_SPEC standard)
+            if entry.is_dir():
+                if is_excluded(module_name):
+                    continue
 
-        modules.append(
-            Module(
-                name=module_name,
-                path=mod_rs,
-                language="rust",
-                is_public=_check_rust_public(mod_rs),
-            )
-        )
-
-    # Pattern 2: src/module.rs (legacy pattern)
-    # DISABLED during MODULE_SPEC migration - matches RSB test.sh behavior
-    # TODO: Re-enable once legacy .rs files are migrated to MODULE_SPEC
-    # for module_rs in src_dir.glob("*.rs"):
-    #     module_name = module_rs.stem
-    #
+                mod_rs = os.path.join(entry.path, "mod.rs")
+                if os.path.isfile(mod_rs):
+                    candidates[module_name] = mod_rs
+
+            # Pattern 2: src/module.rs (legacy pattern)
+            # DISABLED during MODULE_SPEC migration - matches RSB test.sh behavior
+            # TODO: Re-enable once legacy .rs files are migrated to MODULE_SPEC
+            # elif module_name.endswith(".rs"):
+            #     legacy[module_name[:-3]] = entry.path
+
+    # Legacy modules (when re-enabled) are only added if not already
+    # found as mod.rs:
+    # for module_name, module_rs in legacy.items():
     #     # Skip lib.rs and main.rs (always excluded)
-    #     if module_name in ["lib", "main"]:
-    #         continue
-    #
-    #     # Apply exclusion patterns
-    #     if _is_excluded(module_name, exclusions):
+    #     if module_name in ("lib", "main") or is_excluded(module_name):
     #         continue
-    #
-    #     # Only add if not already found as mod.rs
-    #     if not any(m.name == module_name for m in modules):
-    #         modules.append(
-    #             Module(
-    #                 name=module_name,
-    #                 path=module_rs,
-    #                 language="rust",
-    #                 is_public=_check_rust_public(module_rs),
-    #             )
-    #         )
+    #     candidates.setdefault(module_name, module_rs)
+
+    # Publicity checks: cached results first, remaining reads in parallel
+    pub_cache = _load_pub_cache(repo_root)
+    seen_pub = {}
+    names = list(candidates)
+    paths = [candidates[name] for name in names]
+    publicity = _check_rust_public_batch(paths, pub_cache, seen_pub)
+
+    # Persist only entries for modules seen this run (prunes removed ones)
+    if seen_pub != pub_cache:
+        _save_pub_cache(repo_root, seen_pub)
+
+    modules = [
+        Module(name=name, path=Path(path), language="rust", is_public=is_public)
+        for name, path, is_public in zip(names, paths, publicity)
+    ]
 
     return sorted(modules, key=lambda m: m.name)
 
 
-def discover_rust_tests(repo_root: Path, config: Config) -> List[TestFile]:
+def discover_rust_tests(repo_root: Path, config: "Config") -> List[TestFile]:
     """
     Discover Rust test files in tests/ directory.
 
@@ -131,53 +187,78 @@ def discover_rust_tests(repo_root: Path, config: Config) -> List[TestFile]:
     Returns:
         List of discovered test files
     """
-    tests = []
     test_dir = repo_root / config.test_root
 
-    if not test_dir.exists():
-        return tests
-
-    valid_categories = {
-        "sanity",
-        "smoke",
-        "unit",
-        "integration",
-        "e2e",
-        "uat",
-        "chaos",
-        "bench",
-        "regression",
-    }
+    if not test_dir.is_dir():
+        return []
+
+    tests = []
+    category_dirs = []
 
     # Pattern 1 & 3: tests/*.rs files (wrappers and category entries)
-    for test_file in test_dir.glob("*.rs"):
-        basename = test_file.stem
+    # Category subdirectories are collected in the same pass.
+    with os.scandir(test_dir) as it:
+        for entry in it:
+            name = entry.name
+
+            if entry.is_dir():
+                if name in VALID_CATEGORIES:
+                    category_dirs.append(entry)
+                continue
 
-        # Skip excluded patterns (_*, dev_*)
-        if basename.startswith("_") or basename.startswith("dev_"):
-            continue
+            if not name.endswith(".rs") or not entry.is_file():
+                continue
+
+            basename = name[:-3]
+
+            # Skip excluded patterns (_*, dev_*)
+            if basename.startswith(("_", "dev_")):
+                continue
+
+            # Category entry (e.g., sanity.rs) or <category>_<module>.rs
+            match = _CATEGORY_FILE_RE.match(basename)
+            if match is None:
+                continue
 
-        # Check if it's a category entry file (e.g., sanity.rs)
-        if basename in valid_categories:
+            category, module = match.groups()
             tests.append(
                 TestFile(
-                    path=test_file,
-                    category=basename,
-                    module=None,
+                    path=Path(entry.path),
+                    category=sys.intern(category),
+                    module=module,
                     language="rust",
-                    is_category_entry=True,
+                    is_category_entry=module is None,
                 )
             )
-            continue
 
-        # Try to parse category_module pattern
-        parts = basename.split("_", 1)
-        if len(parts) == 2:
-            category, module = parts
-            if category in valid_categories:
+    # Pattern 2: tests/<category>/*.rs files (only dirs that exist)
+    for category_entry in category_dirs:
+        category = sys.intern(category_entry.name)
+        prefix = f"{category}_"
+
+        with os.scandir(category_entry.path) as it:
+            for entry in it:
+                name = entry.name
+                if not name.endswith(".rs") or not entry.is_file():
+                    continue
+
+                basename = name[:-3]
+
+                # Skip excluded patterns
+                if basename.startswith(("_", "dev_")):
+                    continue
+
+                # Module name is the file stem (might be prefixed or not)
+                # Handle prefixed style: sanity/sanity_math.rs
+                if basename.startswith(prefix):
+                    module = basename[len(prefix) :]
+                else:
+                    # Directory style: sanity/math.rs
+                    module = basename
+
                 tests.append(
                     TestFile(
-                        path=test_file,
+                        path=Path(entry.path),
                         category=category,
                         module=module,
                         language="rust",
@@ -185,68 +266,53 @@ def discover_rust_tests(repo_root: Path, config: Config) -> List[TestFile]:
                     )
                 )
 
-    # Pattern 2: tests/<category>/*.rs files
-    for category in valid_categories:
-        category_dir = test_dir / category
-        if not category_dir.exists():
-            continue
-
-        for test_file in category_dir.glob("*.rs"):
-            basename = test_file.stem
-
-            # Skip excluded patterns
-            if basename.startswith("_") or basename.startswith("dev_"):
-                continue
-
-            # Module name is the file stem (might be prefixed or not)
-            # Handle prefixed style: sanity/sanity_math.rs
-            if basename.startswith(f"{category}_"):
-                module = basename[len(category) + 1 :]
-            else:
-                # Directory style: sanity/math.rs
-                module = basename
-
-            tests.append(
-                TestFile(
-                    path=test_file,
-                    category=category,
-                    module=module,
-                    language="rust",
-                    is_category_entry=False,
-                )
-            )
-
     return sorted(tests, key=lambda t: (t.category or "", t.module or ""))
 
 
-def _is_excluded(name: str, exclusions: List[str]) -> bool:
+@functools.lru_cache(maxsize=32)
+def build_exclusion_matcher(exclusions: Tuple[str, ...]) -> Callable[[str], bool]:
     """
-    Check if module name matches exclusion patterns.
+    Build a matcher specialized for one set of exclusion patterns.
+
+    Patterns are partitioned into prefix, suffix and exact forms and
+    compiled into a straight-line function with the patterns inlined as
+    constants - no per-pattern loop and no checks for empty groups.
+    Supported wildcards:
+    - "dev_*" → prefix match ('dev' itself is NOT excluded, only dev_*)
+    - "*.pyc" → suffix match
+    - anything else → exact match
 
     Args:
-        name: Module name to check
-        exclusions: List of exclusion patterns
+        exclusions: Tuple of exclusion patterns
 
     Returns:
-        True if excluded, False otherwise
+        Function returning True if a name is excluded
     """
+    prefixes = []
+    suffixes = []
+    exact = []
     for pattern in exclusions:
-        # Simple wildcard matching
         if pattern.endswith("*"):
-            prefix = pattern[:-1]
-            if name.startswith(prefix):
-                # Special case: 'dev' itself is NOT excluded, only dev_*
-                if pattern == "dev_*" and name == "dev":
-                    continue
-                return True
+            prefixes.append(pattern[:-1])
         elif pattern.startswith("*"):
-            suffix = pattern[1:]
-            if name.endswith(suffix):
-                return True
-        elif pattern == name:
-            return True
-
-    return False
+            suffixes.append(pattern[1:])
+        else:
+            exact.append(pattern)
+
+    # Patterns are embedded via repr(), so any string is safe source
+    terms = []
+    if prefixes:
+        terms.append(f"name.startswith({tuple(prefixes)!r})")
+    if suffixes:
+        terms.append(f"name.endswith({tuple(suffixes)!r})")
+    if exact:
+        # Set literal in an 'in' test is folded to a frozenset constant
+        terms.append("name in {" + ", ".join(map(repr, sorted(set(exact)))) + "}")
+
+    source = "def is_excluded(name):\n    return " + (" or ".join(terms) or "False") + "\n"
+    namespace = {}
+    exec(compile(source, "<exclusion-matcher>", "exec"), namespace)
+    return namespace["is_excluded"]
 
 
 def _check_rust_public(module_path: Path) -> bool:
@@ -254,6 +320,8 @@ def _check_rust_public(module_path: Path) -> bool:
     Check if Rust module has pub keyword (is public).
 
     Simple heuristic: check if file contains 'pub ' keyword.
+    Scans raw bytes in chunks and stops at the first hit, so large
+    files are neither fully read nor decoded.
 
     Args:
         module_path: Path to Rust module file
@@ -262,45 +330,158 @@ def _check_rust_public(module_path: Path) -> bool:
         True if module appears to be public
     """
     try:
-        content = module_path.read_text()
-        # Simple check: does file contain 'pub '?
-        return "pub " in content or "pub(" in content
+        with open(module_path, "rb") as f:
+            tail = b""
+            while True:
+                chunk = f.read(_PUB_SCAN_CHUNK)
+                if not chunk:
+                    return False
+
+                # Keep a 3-byte overlap so matches spanning chunks are found
+                buf = tail + chunk
+                if b"pub " in buf or b"pub(" in buf:
+                    return True
+                tail = buf[-3:]
     except Exception:
         # Default to True if can't read
         return True
 
 
+@functools.lru_cache(maxsize=1024)
+def _check_rust_public_at(path: str, mtime_ns: int, size: int) -> bool:
+    """In-process memoization of _check_rust_public by (path, mtime, size)."""
+    return _check_rust_public(Path(path))
+
+
+def _check_rust_public_batch(
+    paths: List[str], pub_cache: Dict[str, list], seen: Dict[str, list]
+) -> List[bool]:
+    """
+    Check publicity of many modules, reusing cached results.
+
+    Files unchanged since the cached entry (same mtime and size) are not
+    read. Remaining files are scanned concurrently in a thread pool - the
+    GIL is released during read(), so I/O latency overlaps.
+
+    Args:
+        paths: Paths to Rust module files
+        pub_cache: Entries loaded from the persistent cache
+        seen: Entries for this run (updated in place)
+
+    Returns:
+        Publicity flags in the same order as paths
+    """
+    results = [True] * len(paths)
+    misses = []  # (index, path, mtime_ns, size)
+
+    for i, path in enumerate(paths):
+        try:
+            st = os.stat(path)
+        except OSError:
+            results[i] = _check_rust_public(Path(path))
+            continue
+
+        entry = pub_cache.get(path)
+        if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            seen[path] = entry
+            results[i] = entry[2]
+        else:
+            misses.append((i, path, st.st_mtime_ns, st.st_size))
+
+    if len(misses) >= _PUB_SCAN_PARALLEL_MIN:
+        from concurrent.futures import ThreadPoolExecutor
+
+        workers = min(32, (os.cpu_count() or 1) * 4, len(misses))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            computed = list(
+                executor.map(lambda m: _check_rust_public_at(*m[1:]), misses)
+            )
+    else:
+        computed = [_check_rust_public_at(*m[1:]) for m in misses]
+
+    for (i, path, mtime_ns, size), is_public in zip(misses, computed):
+        seen[path] = [mtime_ns, size, is_public]
+        results[i] = is_public
+
+    return results
+
+
+def _load_pub_cache(repo_root: Path) -> Dict[str, list]:
+    """Load persistent publicity cache (empty dict if missing or invalid)."""
+    from testpy.cache import cache_file, read_json
+
+    data = read_json(cache_file(_PUB_CACHE_KIND, repo_root))
+    return data if isinstance(data, dict) else {}
+
+
+def _save_pub_cache(repo_root: Path, data: Dict[str, list]) -> None:
+    """Write publicity cache (failures ignored - optimization only)."""
+    from testpy.cache import cache_file, write_json
+
+    write_json(cache_file(_PUB_CACHE_KIND, repo_root), data)
+
+
+def build_test_index(tests: List[TestFile]) -> TestIndex:
+    """
+    Build lookup index for discovered tests.
+
+    Args:
+        tests: List of discovered tests
+
+    Returns:
+        TestIndex keyed by (category, module) and category entry
+    """
+    index = TestIndex(tests=tests)
+    by_pair = index.by_pair
+    entries = index.entries
+
+    for test in tests:
+        if test.is_category_entry:
+            entries.setdefault(test.category, test)
+        by_pair.setdefault((test.category, test.module), test)
+
+    return index
+
+
 def find_test_for_module(
-    module: Module, tests: List[TestFile], category: str
+    module: Module, tests: Union[List[TestFile], TestIndex], category: str
 ) -> Optional[TestFile]:
     """
     Find test file for a specific module and category.
 
     Args:
         module: Module to find test for
-        tests: List of discovered tests
+        tests: List of discovered tests, or a TestIndex for O(1) lookup
         category: Test category (e.g., "sanity", "uat")
 
     Returns:
         TestFile if found, None otherwise
     """
+    if isinstance(tests, TestIndex):
+        return tests.by_pair.get((category, module.name))
+
     for test in tests:
         if test.category == category and test.module == module.name:
             return test
     return None
 
 
-def get_category_entry_file(tests: List[TestFile], category: str) -> Optional[TestFile]:
+def get_category_entry_file(
+    tests: Union[List[TestFile], TestIndex], category: str
+) -> Optional[TestFile]:
     """
     Get category entry file for a category.
 
     Args:
-        tests: List of discovered tests
+        tests: List of discovered tests, or a TestIndex for O(1) lookup
         category: Category name (e.g., "sanity")
 
     Returns:
         TestFile if category entry exists, None otherwise
     """
+    if isinstance(tests, TestIndex):
+        return tests.entries.get(category)
+
     for test in tests:
         if test.is_category_entry and test.category == category:
             return test
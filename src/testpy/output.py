@@ -4,6 +4,7 @@ Output and display system for testpy.
 Provides boxy integration for pretty terminal output with graceful fallback.
 """
 
+import functools
 import os
 import shutil
 import subprocess
@@ -31,8 +32,32 @@ class Theme(Enum):
 
 
 # Global settings
-_OUTPUT_MODE = OutputMode.PRETTY
+_OUTPUT_MODE: Optional[OutputMode] = None  # None = auto (see get_output_mode)
 _BOXY_AVAILABLE = None  # Cache boxy availability check
+_BOXY_PATH: Optional[str] = None  # Resolved boxy executable (set when available)
+
+# Environment flags, read once at import (see reset_output_cache)
+_DEBUG_ENABLED = os.getenv("TESTPY_DEBUG") == "1"
+_BOXY_DISABLED = os.getenv("REPOS_USE_BOXY") == "1"  # 1=disabled, 0=enabled
+_BOXY_VERIFY = os.getenv("TESTPY_VERIFY_BOXY") == "1"  # Run `boxy --version` probe
+_PLAIN_ENV = bool(os.getenv("NO_COLOR")) or os.getenv("CI", "").lower() not in ("", "0", "false")
+
+
+def reset_output_cache() -> None:
+    """
+    Re-read output environment flags and forget the boxy availability check.
+
+    Call after changing TESTPY_DEBUG, REPOS_USE_BOXY, TESTPY_VERIFY_BOXY,
+    NO_COLOR or CI at runtime (e.g. in tests).
+    """
+    global _BOXY_AVAILABLE, _BOXY_PATH, _DEBUG_ENABLED, _BOXY_DISABLED, _BOXY_VERIFY, _PLAIN_ENV
+
+    _BOXY_AVAILABLE = None
+    _BOXY_PATH = None
+    _DEBUG_ENABLED = os.getenv("TESTPY_DEBUG") == "1"
+    _BOXY_DISABLED = os.getenv("REPOS_USE_BOXY") == "1"
+    _BOXY_VERIFY = os.getenv("TESTPY_VERIFY_BOXY") == "1"
+    _PLAIN_ENV = bool(os.getenv("NO_COLOR")) or os.getenv("CI", "").lower() not in ("", "0", "false")
 
 
 def check_boxy_availability() -> bool:
@@ -42,14 +67,14 @@ def check_boxy_availability() -> bool:
     Returns:
         True if boxy is available, False otherwise
     """
-    global _BOXY_AVAILABLE
+    global _BOXY_AVAILABLE, _BOXY_PATH
 
     # Return cached result if already checked
     if _BOXY_AVAILABLE is not None:
         return _BOXY_AVAILABLE
 
     # Check REPOS_USE_BOXY environment variable (1=disabled, 0=enabled)
-    if os.getenv("REPOS_USE_BOXY") == "1":
+    if _BOXY_DISABLED:
         _BOXY_AVAILABLE = False
         return False
 
@@ -59,6 +84,13 @@ def check_boxy_availability() -> bool:
         _BOXY_AVAILABLE = False
         return False
 
+    # An executable on PATH is trusted; the `boxy --version` fork+exec only
+    # runs when explicitly requested (TESTPY_VERIFY_BOXY=1)
+    if not _BOXY_VERIFY:
+        _BOXY_AVAILABLE = os.access(boxy_path, os.X_OK)
+        _BOXY_PATH = boxy_path if _BOXY_AVAILABLE else None
+        return _BOXY_AVAILABLE
+
     # Verify boxy works by checking version
     try:
         result = subprocess.run(
@@ -68,6 +100,7 @@ def check_boxy_availability() -> bool:
             text=True
         )
         _BOXY_AVAILABLE = result.returncode == 0
+        _BOXY_PATH = boxy_path if _BOXY_AVAILABLE else None
         return _BOXY_AVAILABLE
     except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
         _BOXY_AVAILABLE = False
@@ -89,10 +122,20 @@ def get_output_mode() -> OutputMode:
     """
     Get current output mode.
 
+    Without an explicit set_output_mode(), PRETTY is used only when stdout
+    is a terminal and neither NO_COLOR nor CI is set; otherwise DATA, so
+    redirected and CI runs never spawn boxy.
+
     Returns:
         Current OutputMode
     """
-    return _OUTPUT_MODE
+    if _OUTPUT_MODE is not None:
+        return _OUTPUT_MODE
+
+    if _PLAIN_ENV or sys.stdout is None or not sys.stdout.isatty():
+        return OutputMode.DATA
+
+    return OutputMode.PRETTY
 
 
 def boxy_display(
@@ -114,7 +157,7 @@ def boxy_display(
         True if displayed via boxy, False if fallback used
     """
     # Force plain output in DATA mode
-    if _OUTPUT_MODE == OutputMode.DATA:
+    if get_output_mode() == OutputMode.DATA:
         _plain_output(content, theme.value, title)
         return False
 
@@ -123,8 +166,8 @@ def boxy_display(
         _plain_output(content, theme.value, title)
         return False
 
-    # Build boxy command
-    cmd = ["boxy"]
+    # Build boxy command (path resolved once by check_boxy_availability)
+    cmd = [_BOXY_PATH]
 
     if theme != Theme.PLAIN:
         cmd.extend(["--theme", theme.value])
@@ -168,56 +211,59 @@ def _plain_output(content: str, theme: str, title: Optional[str]) -> None:
         theme: Theme name (for header)
         title: Optional title
     """
-    # Print to stderr for visibility
-    if title:
-        print(f"[{theme}] {title}", file=sys.stderr)
-
-    print(content, file=sys.stderr)
-    print()  # Empty line after content
+    # Print to stderr for visibility, as one write (empty line after content)
+    header = f"[{theme}] {title}\n" if title else ""
+    _write_stderr(f"{header}{content}\n\n")
 
 
-def success(message: str, title: Optional[str] = None) -> None:
+def _write_stderr(text: str) -> None:
     """
-    Display success message with green theme.
+    Write text to stderr with a single write call.
+
+    Writes stay synchronous so stderr keeps its order relative to stdout
+    in merged logs (2>&1, CI).
 
     Args:
-        message: Success message
-        title: Optional title
+        text: Text to write
     """
-    boxy_display(message, Theme.SUCCESS, title or "✓ Success")
+    sys.stderr.write(text)
 
 
-def warning(message: str, title: Optional[str] = None) -> None:
-    """
-    Display warning message with yellow theme.
-
-    Args:
-        message: Warning message
-        title: Optional title
-    """
-    boxy_display(message, Theme.WARNING, title or "⚠ Warning")
+# Theme and default title per message kind
+_NOTIFY_DEFAULTS = {
+    "success": (Theme.SUCCESS, "✓ Success"),
+    "warning": (Theme.WARNING, "⚠ Warning"),
+    "error": (Theme.ERROR, "✗ Error"),
+    "info": (Theme.INFO, "ℹ Info"),
+}
 
 
-def error(message: str, title: Optional[str] = None) -> None:
+def _notify(kind: str, message: str, title: Optional[str] = None) -> None:
     """
-    Display error message with red theme.
+    Display message with the theme and default title for its kind.
 
     Args:
-        message: Error message
-        title: Optional title
+        kind: Key into _NOTIFY_DEFAULTS ("success", "warning", "error", "info")
+        message: Message to display
+        title: Optional title (defaults per kind)
     """
-    boxy_display(message, Theme.ERROR, title or "✗ Error")
+    theme, default_title = _NOTIFY_DEFAULTS[kind]
+    boxy_display(message, theme, title or default_title)
 
 
-def info(message: str, title: Optional[str] = None) -> None:
-    """
-    Display informational message with blue theme.
+# Public helpers: success/warning/error/info(message, title=None).
+# Bound with functools.partial, so calling one adds no extra Python frame.
+success = functools.partial(_notify, "success")
+success.__doc__ = "Display success message with green theme."
 
-    Args:
-        message: Info message
-        title: Optional title
-    """
-    boxy_display(message, Theme.INFO, title or "ℹ Info")
+warning = functools.partial(_notify, "warning")
+warning.__doc__ = "Display warning message with yellow theme."
+
+error = functools.partial(_notify, "error")
+error.__doc__ = "Display error message with red theme."
+
+info = functools.partial(_notify, "info")
+info.__doc__ = "Display informational message with blue theme."
 
 
 def plain(message: str) -> None:
@@ -249,7 +295,7 @@ def print_error(message: str) -> None:
     Args:
         message: Error message
     """
-    print(f"testpy: {message}", file=sys.stderr)
+    _write_stderr(f"testpy: {message}\n")
 
 
 def print_debug(message: str) -> None:
@@ -259,5 +305,5 @@ def print_debug(message: str) -> None:
     Args:
         message: Debug message
     """
-    if os.getenv("TESTPY_DEBUG") == "1":
-        print(f"[DEBUG] {message}", file=sys.stderr)
+    if _DEBUG_ENABLED:
+        _write_stderr(f"[DEBUG] {message}\n")
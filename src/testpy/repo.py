@@ -4,11 +4,34 @@ Repository detection and validation for testpy.
 Detects project type, validates requirements, and provides repository context.
 """
 
+import functools
+import os
 from dataclasses import dataclass
+from itertools import chain
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from testpy.config import Config, create_default_config, load_config, validate_config
+from testpy.config import Config, create_default_config, load_config, load_toml, validate_config
+
+# Project manifests marking a repository root (besides .git)
+_MANIFEST_NAMES = frozenset({"Cargo.toml", "pyproject.toml", "package.json", "setup.py"})
+
+# Directories never walked when counting source files (build output, deps, VCS)
+_SKIP_DIRS = frozenset(
+    {"target", "node_modules", ".git", ".venv", "dist", "build", "__pycache__"}
+)
+
+# Matching source files after which language detection stops counting;
+# by then the leader is clear enough to pick a primary language
+_DETECT_FILE_LIMIT = 5000
+
+# Source file extensions counted per language
+_LANG_EXTENSIONS = {
+    "rust": (".rs",),
+    "python": (".py",),
+    "nodejs": (".js", ".ts"),
+    "shell": (".sh",),
+}
 
 
 @dataclass
@@ -49,6 +72,8 @@ def find_repo_root(start_path: Optional[Path] = None) -> Optional[Path]:
     Find repository root by walking up directory tree.
 
     Looks for .git directory or manifest files (Cargo.toml, pyproject.toml, etc.)
+    Results are memoized per resolved start directory; call
+    find_repo_root.cache_clear() to forget them.
 
     Args:
         start_path: Starting directory (defaults to current directory)
@@ -59,28 +84,43 @@ def find_repo_root(start_path: Optional[Path] = None) -> Optional[Path]:
     if start_path is None:
         start_path = Path.cwd()
 
-    current = start_path.resolve()
+    root = _find_repo_root_cached(str(start_path.resolve()))
+    return Path(root) if root is not None else None
+
 
-    # Walk up directory tree
-    for parent in [current] + list(current.parents):
-        # Primary indicator: .git directory
-        if (parent / ".git").exists():
-            return parent
+@functools.lru_cache(maxsize=32)
+def _find_repo_root_cached(start: str) -> Optional[str]:
+    """
+    Walk up from a resolved start directory (memoized per process).
+
+    Args:
+        start: Resolved starting directory
+
+    Returns:
+        Repository root as a string, or None if not found
+    """
+    current = Path(start)
 
-        # Secondary indicators: project manifest files
-        manifest_files = [
-            "Cargo.toml",
-            "pyproject.toml",
-            "package.json",
-            "setup.py",
-        ]
+    # Walk up directory tree, reading each level once instead of probing
+    # every marker with its own stat
+    for parent in chain([current], current.parents):
+        try:
+            with os.scandir(parent) as it:
+                names = {entry.name for entry in it}
+        except OSError:
+            continue  # Unreadable level: no markers visible, keep walking
 
-        if any((parent / f).exists() for f in manifest_files):
-            return parent
+        # Primary indicator: .git directory; secondary: project manifests
+        if ".git" in names or not _MANIFEST_NAMES.isdisjoint(names):
+            return str(parent)
 
     return None
 
 
+# Tests (or long-lived callers) can drop memoized roots after moving trees
+find_repo_root.cache_clear = _find_repo_root_cached.cache_clear
+
+
 def detect_primary_language(repo_root: Path, languages: List[str]) -> str:
     """
     Detect primary language by counting source files.
@@ -98,23 +138,17 @@ def detect_primary_language(repo_root: Path, languages: List[str]) -> str:
     if len(languages) == 1:
         return languages[0]
 
-    # Count files by extension for each language
-    counts = {}
-
-    for lang in languages:
-        if lang == "rust":
-            count = len(list(repo_root.glob("**/*.rs")))
-            counts[lang] = count
-        elif lang == "python":
-            count = len(list(repo_root.glob("**/*.py")))
-            counts[lang] = count
-        elif lang == "nodejs":
-            js_count = len(list(repo_root.glob("**/*.js")))
-            ts_count = len(list(repo_root.glob("**/*.ts")))
-            counts[lang] = js_count + ts_count
-        elif lang == "shell":
-            count = len(list(repo_root.glob("**/*.sh")))
-            counts[lang] = count
+    # Count files by extension for each language (one pruned walk for all)
+    ext_counts = _count_extensions(
+        repo_root,
+        [ext for lang in languages for ext in _LANG_EXTENSIONS.get(lang, ())],
+        limit=_DETECT_FILE_LIMIT,
+    )
+    counts = {
+        lang: sum(ext_counts[ext] for ext in _LANG_EXTENSIONS[lang])
+        for lang in languages
+        if lang in _LANG_EXTENSIONS
+    }
 
     # Return language with highest count
     if counts:
@@ -123,6 +157,54 @@ def detect_primary_language(repo_root: Path, languages: List[str]) -> str:
     return languages[0]  # Fallback to first language
 
 
+def _count_extensions(
+    repo_root: Path,
+    extensions: Iterable[str],
+    limit: Optional[int] = None,
+) -> Dict[str, int]:
+    """
+    Count files per extension in a single os.scandir walk.
+
+    Skips _SKIP_DIRS (e.g. target/, node_modules/, .git/) and does not
+    follow directory symlinks.
+
+    Args:
+        repo_root: Directory to walk
+        extensions: Extensions to count, with leading dot (e.g. ".rs")
+        limit: Stop once this many matching files have been counted
+
+    Returns:
+        Dict mapping each extension to its file count (partial if limit hit)
+    """
+    counts = dict.fromkeys(extensions, 0)
+    stack = [str(repo_root)]
+    remaining = limit
+
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in _SKIP_DIRS:
+                                stack.append(entry.path)
+                            continue
+                    except OSError:
+                        continue
+
+                    ext = os.path.splitext(entry.name)[1]
+                    if ext in counts:
+                        counts[ext] += 1
+                        if remaining is not None:
+                            remaining -= 1
+                            if remaining == 0:
+                                return counts
+        except OSError:
+            continue  # Unreadable directory
+
+    return counts
+
+
 def create_repo_context(start_path: Optional[Path] = None) -> RepoContext:
     """
     Create repository context from current or specified directory.
@@ -218,7 +300,7 @@ def validate_language_requirements(repo_root: Path, language: str) -> List[str]:
 
 def _load_toml_file(path: Path) -> Optional[dict]:
     """
-    Load TOML file with library version handling.
+    Load TOML file with the parser selected by testpy.config.
 
     Args:
         path: Path to TOML file
@@ -226,30 +308,51 @@ def _load_toml_file(path: Path) -> Optional[dict]:
     Returns:
         Parsed TOML data as dict, or None if file doesn't exist or can't be parsed
     """
-    if not path.exists():
-        return None
-
     try:
-        import sys
-        if sys.version_info >= (3, 11):
-            import tomllib
-        else:
-            try:
-                import tomli as tomllib
-            except ImportError:
-                return None
-
-        with open(path, "rb") as f:
-            return tomllib.load(f)
+        return load_toml(path)
     except Exception:
         return None
 
 
+def _cargo_project_name(path: Path) -> Optional[str]:
+    """Project name from Cargo.toml ([package].name)."""
+    data = _load_toml_file(path)
+    return data.get("package", {}).get("name") if data else None
+
+
+def _pyproject_project_name(path: Path) -> Optional[str]:
+    """Project name from pyproject.toml ([project].name)."""
+    data = _load_toml_file(path)
+    return data.get("project", {}).get("name") if data else None
+
+
+def _package_json_name(path: Path) -> Optional[str]:
+    """Project name from package.json ("name")."""
+    import json
+
+    with open(path) as f:
+        return json.load(f).get("name")
+
+
+# Manifests consulted for the project name, in priority order
+_MANIFEST_NAME_SOURCES = (
+    ("Cargo.toml", _cargo_project_name),
+    ("pyproject.toml", _pyproject_project_name),
+    ("package.json", _package_json_name),
+)
+
+# Parsed project names keyed by (manifest path, mtime_ns); cleared when it
+# reaches _MANIFEST_NAME_CACHE_SIZE entries
+_MANIFEST_NAME_CACHE: Dict[Tuple[str, int], Optional[str]] = {}
+_MANIFEST_NAME_CACHE_SIZE = 64
+
+
 def get_manifest_project_name(repo_root: Path) -> Optional[str]:
     """
     Get project name from manifest files.
 
-    Tries in order: Cargo.toml, pyproject.toml, package.json
+    Tries in order: Cargo.toml, pyproject.toml, package.json. Each manifest
+    is parsed once per modification time.
 
     Args:
         repo_root: Repository root directory
@@ -257,31 +360,25 @@ def get_manifest_project_name(repo_root: Path) -> Optional[str]:
     Returns:
         Project name if found, None otherwise
     """
-    # Try Cargo.toml
-    cargo_data = _load_toml_file(repo_root / "Cargo.toml")
-    if cargo_data:
-        package_name = cargo_data.get("package", {}).get("name")
-        if package_name:
-            return package_name
-
-    # Try pyproject.toml
-    pyproject_data = _load_toml_file(repo_root / "pyproject.toml")
-    if pyproject_data:
-        project_name = pyproject_data.get("project", {}).get("name")
-        if project_name:
-            return project_name
-
-    # Try package.json
-    package_json = repo_root / "package.json"
-    if package_json.exists():
+    for filename, read_name in _MANIFEST_NAME_SOURCES:
+        path = repo_root / filename
         try:
-            import json
-            with open(package_json) as f:
-                data = json.load(f)
-                name = data.get("name")
-                if name:
-                    return name
-        except Exception:
-            pass
+            key = (str(path), os.stat(path).st_mtime_ns)
+        except OSError:
+            continue  # Manifest not present
+
+        if key in _MANIFEST_NAME_CACHE:
+            name = _MANIFEST_NAME_CACHE[key]
+        else:
+            try:
+                name = read_name(path)
+            except Exception:
+                name = None
+            if len(_MANIFEST_NAME_CACHE) >= _MANIFEST_NAME_CACHE_SIZE:
+                _MANIFEST_NAME_CACHE.clear()
+            _MANIFEST_NAME_CACHE[key] = name
+
+        if name:
+            return name
 
     return None
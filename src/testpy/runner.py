@@ -4,12 +4,31 @@ Test execution runner for testpy.
 Executes tests with timeout support and captures results.
 """
 
+import os
 import re
-import shutil
+import signal
 import subprocess
+import threading
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import IO, Deque, Dict, Optional, List, Tuple
+
+# Summary line: "test result: ok. 5 passed; 0 failed; 0 ignored; 0 measured; 0 filtered out"
+_SUMMARY_RE = re.compile(r"test result:.*?(\d+) passed.*?(\d+) failed.*?(\d+) ignored")
+
+# Summary and duration in one alternation, so each output line is scanned once.
+# Bytes pattern: cargo output is parsed undecoded (int()/float() accept bytes)
+_CARGO_LINE_RE = re.compile(
+    rb"test result:.*?(?P<passed>\d+) passed.*?(?P<failed>\d+) failed.*?(?P<ignored>\d+) ignored"
+    rb"|finished in (?P<duration>\d+(?:\.\d+)?)s"
+)
+
+# Lines of cargo output buffered while running (bounded memory on noisy runs)
+_OUTPUT_TAIL_LINES = 10_000
+
+# Bytes of that tail decoded into TestResult.output
+_OUTPUT_TAIL_BYTES = 65536
 
 
 @dataclass
@@ -30,24 +49,23 @@ class TestResult:
         return self.exit_code == 0
 
 
-def find_timeout_command() -> Optional[str]:
+def _kill_process_group(proc: subprocess.Popen) -> None:
     """
-    Find timeout command (timeout or gtimeout).
+    Kill a child started in its own session, including its descendants.
 
-    Returns:
-        Path to timeout command, or None if not available
-    """
-    # Try GNU timeout first
-    timeout_path = shutil.which("timeout")
-    if timeout_path:
-        return timeout_path
-
-    # Try gtimeout (macOS/BSD)
-    gtimeout_path = shutil.which("gtimeout")
-    if gtimeout_path:
-        return gtimeout_path
+    cargo spawns the test binaries as grandchildren, which would otherwise
+    survive the kill and keep the output pipes open.
 
-    return None
+    Args:
+        proc: Process started with start_new_session=True
+    """
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except (ProcessLookupError, PermissionError):
+        pass
 
 
 def parse_cargo_test_output(output: str) -> Tuple[int, int, int]:
@@ -65,8 +83,7 @@ def parse_cargo_test_output(output: str) -> Tuple[int, int, int]:
     ignored = 0
 
     # Look for summary line: "test result: ok. 5 passed; 0 failed; 0 ignored; 0 measured; 0 filtered out"
-    summary_pattern = r"test result:.*?(\d+) passed.*?(\d+) failed.*?(\d+) ignored"
-    match = re.search(summary_pattern, output)
+    match = _SUMMARY_RE.search(output)
 
     if match:
         passed = int(match.group(1))
@@ -76,6 +93,61 @@ def parse_cargo_test_output(output: str) -> Tuple[int, int, int]:
     return passed, failed, ignored
 
 
+def _stream_cargo_output(stream: IO[bytes], tail: Deque[bytes], found: Dict[str, object]) -> None:
+    """
+    Drain cargo output line by line, keeping a bounded tail and parsing as it goes.
+
+    Runs on a reader thread so the pipe never fills while cargo is running.
+    The first summary and duration lines win, matching a search over the
+    whole output.
+
+    Args:
+        stream: cargo's merged stdout/stderr pipe (binary)
+        tail: Bounded buffer receiving the most recent raw lines
+        found: Receives "summary" (passed, failed, ignored) and "duration"
+    """
+    with stream:
+        for line in stream:
+            tail.append(line)
+
+            if len(found) == 2:
+                continue  # Both found; just keep the tail
+
+            for match in _CARGO_LINE_RE.finditer(line):
+                if match.group("passed") is not None:
+                    found.setdefault(
+                        "summary",
+                        (int(match.group("passed")), int(match.group("failed")), int(match.group("ignored"))),
+                    )
+                else:
+                    found.setdefault("duration", float(match.group("duration")))
+
+
+def _decode_tail(tail: Deque[bytes]) -> str:
+    """
+    Decode the last _OUTPUT_TAIL_BYTES of buffered output, on line boundaries.
+
+    Only this slice is ever decoded; earlier output is never converted to str.
+
+    Args:
+        tail: Raw output lines, oldest first
+
+    Returns:
+        Decoded output tail (invalid UTF-8 replaced)
+    """
+    kept = []
+    size = 0
+    for line in reversed(tail):
+        if size + len(line) > _OUTPUT_TAIL_BYTES:
+            if not kept:
+                kept.append(line[-_OUTPUT_TAIL_BYTES:])  # Single oversized line
+            break
+        kept.append(line)
+        size += len(line)
+
+    return b"".join(reversed(kept)).decode("utf-8", errors="replace")
+
+
 def run_cargo_test(
     repo_root: Path,
     category: Optional[str] = None,
@@ -110,38 +182,43 @@ def run_cargo_test(
         # Module only: run all tests for that module
         cmd.append(module)
 
-    # Find timeout command
-    timeout_bin = find_timeout_command()
-
-    # Prepare final command with timeout wrapper
-    if timeout_bin:
-        # Use timeout command wrapper
-        final_cmd = [timeout_bin, f"{timeout}s"] + cmd
-    else:
-        # No timeout wrapper available, use subprocess timeout
-        final_cmd = cmd
+    # Output is streamed through a reader thread into a bounded tail and
+    # parsed per line as bytes, instead of buffering and decoding the whole capture
+    tail: Deque[bytes] = deque(maxlen=_OUTPUT_TAIL_LINES)
+    found: Dict[str, object] = {}
 
-    # Execute command
+    # Execute command (own session so a timeout can kill cargo's test binaries too)
     try:
-        result = subprocess.run(
-            final_cmd,
+        proc = subprocess.Popen(
+            cmd,
             cwd=repo_root,
-            capture_output=True,
-            timeout=timeout if not timeout_bin else None,  # Only use subprocess timeout if no timeout bin
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
         )
-
-        # Parse output for test counts
-        combined_output = result.stdout + result.stderr
-        passed, failed, ignored = parse_cargo_test_output(combined_output)
+        reader = threading.Thread(
+            target=_stream_cargo_output,
+            args=(proc.stdout, tail, found),
+            daemon=True,
+        )
+        reader.start()
+
+        try:
+            proc.wait(timeout=timeout)
+        except BaseException:
+            # Timeout, or e.g. KeyboardInterrupt: the new session doesn't get
+            # the terminal's SIGINT, so cargo must be killed explicitly
+            _kill_process_group(proc)
+            proc.wait()
+            reader.join()
+            raise
+
+        reader.join()
+
+        # Counts and duration were parsed while streaming
+        passed, failed, ignored = found.get("summary", (0, 0, 0))
         total = passed + failed + ignored
-
-        # Extract duration if available
-        duration = 0.0
-        duration_pattern = r"finished in ([\d.]+)s"
-        duration_match = re.search(duration_pattern, combined_output)
-        if duration_match:
-            duration = float(duration_match.group(1))
+        duration = found.get("duration", 0.0)
 
         return TestResult(
             passed=passed,
@@ -149,17 +226,13 @@ def run_cargo_test(
             ignored=ignored,
             total=total,
             duration=duration,
-            output=combined_output,
-            exit_code=result.returncode,
+            output=_decode_tail(tail),
+            exit_code=proc.returncode,
         )
 
-    except subprocess.TimeoutExpired as e:
+    except subprocess.TimeoutExpired:
         # Timeout occurred
-        output = ""
-        if e.stdout:
-            output += e.stdout if isinstance(e.stdout, str) else e.stdout.decode('utf-8', errors='replace')
-        if e.stderr:
-            output += e.stderr if isinstance(e.stderr, str) else e.stderr.decode('utf-8', errors='replace')
+        output = _decode_tail(tail)
 
         return TestResult(
             passed=0,
@@ -217,3 +290,4 @@ def run_rust_tests(
         TestResult with execution results
     """
     return run_cargo_test(repo_root, category, module, timeout)
+
@@ -4,15 +4,197 @@ Test organization validation for testpy.
 Enforces RSB test organization standards with categorized violation reporting.
 """
 
+import functools
+import io
+import mmap
+import os
+import re
+import sys
 from dataclasses import dataclass, field
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from testpy.config import Config
-from testpy.discovery import Module, TestFile, discover_rust_modules, discover_rust_tests
-
-
-@dataclass
+from testpy.constants import TEST_CATEGORIES, VALID_CATEGORIES
+from testpy.discovery import (
+    Module,
+    TestFile,
+    TestIndex,
+    build_test_index,
+    discover_rust_modules,
+    discover_rust_tests,
+)
+
+# dataclass(slots=True) requires Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Valid tests/ subdirectories: categories plus sh/, _archive/, _adhoc/
+VALID_DIRS = VALID_CATEGORIES | frozenset({"sh", "_archive", "_adhoc"})
+
+# Required category entry files (report order)
+REQUIRED_CATEGORY_ENTRIES = TEST_CATEGORIES
+
+# tests/ root file extensions the checks look at
+_ROOT_SUFFIXES = (".rs", ".sh")
+
+# Root file stems skipped by the naming checks
+_EXCLUDED_PREFIXES = ("_", "dev_")
+
+# <category>_<module> root file stem (categories contain no "_", so a
+# prefix match is equivalent to splitting on the first underscore)
+_CATEGORY_MODULE_RE = re.compile(r"(?:%s)_" % "|".join(TEST_CATEGORIES))
+
+
+# Report section templates, rendered once at import time. Each section is a
+# single str.format with {count} and {items} (the pre-joined numbered list)
+_SECTION_RULE = "-" * 80 + "\n"
+_REPORT_HEADER = (
+    "📋 Test Organization Violations Report ({total} total)\n" + "=" * 80 + "\n\n"
+)
+
+_NAMING_SECTION = (
+    "🏷️  NAMING VIOLATIONS ({count} files)\n"
+    + _SECTION_RULE
+    + "Issue: Test wrapper files don't follow naming pattern\n"
+    "Required: <category>_<module>.rs (e.g., sanity_com.rs, uat_math.rs)\n"
+    "Valid categories: unit, sanity, smoke, integration, e2e, uat, chaos, bench\n"
+    "\n"
+    "{items}"
+    "\n"
+    "Fix: Rename files to match pattern (e.g., com_sanity.rs → sanity_com.rs)\n"
+    "\n"
+)
+
+_SANITY_SECTION = (
+    "🚨 MISSING SANITY TESTS ({count} modules)\n"
+    + _SECTION_RULE
+    + "Issue: Modules without required sanity tests\n"
+    "Required: Every module must have sanity tests for core functionality\n"
+    "\n"
+    "{items}"
+    "\n"
+    "Fix: Create sanity test files for each module\n"
+    "\n"
+)
+
+_UAT_SECTION = (
+    "🎭 MISSING UAT TESTS ({count} modules)\n"
+    + _SECTION_RULE
+    + "Issue: Modules without required visual UAT/ceremony tests\n"
+    "Required: Every module must have UAT tests for visual demonstrations\n"
+    "\n"
+    "{items}"
+    "\n"
+    "Fix: Create UAT test files with visual demonstrations for each module\n"
+    "\n"
+)
+
+_CATEGORY_ENTRY_SECTION = (
+    "📋 MISSING CATEGORY ENTRY FILES ({count} categories)\n"
+    + _SECTION_RULE
+    + "Issue: Missing category-level test orchestrators\n"
+    "Required: Each category needs an entry file (e.g., smoke.rs, unit.rs)\n"
+    "\n"
+    "{items}"
+    "\n"
+    "Fix: Create category entry files for cross-module integration tests\n"
+    "\n"
+)
+
+_UNAUTHORIZED_ROOT_SECTION = (
+    "🚫 UNAUTHORIZED ROOT FILES ({count} files)\n"
+    + _SECTION_RULE
+    + "Issue: Files in tests/ root that don't follow organization rules\n"
+    "Allowed: <category>.rs or <category>_<module>.rs only\n"
+    "\n"
+    "{items}"
+    "\n"
+    "Fix: Rename to pattern, move to tests/_adhoc/, or move to tests/_archive/\n"
+    "\n"
+)
+
+_INVALID_DIRS_SECTION = (
+    "📁 INVALID DIRECTORIES ({count} directories)\n"
+    + _SECTION_RULE
+    + "Issue: Test directories don't match approved organization\n"
+    "Valid: unit/, sanity/, smoke/, integration/, e2e/, uat/, chaos/, bench/, regression/, sh/, _archive/, _adhoc/\n"
+    "\n"
+    "{items}"
+    "\n"
+    "Fix: Move tests to approved category directories or rename to _archive/\n"
+    "\n"
+)
+
+_HUB_SECTION = (
+    "🔌 MISSING HUB INTEGRATION TESTS ({count} packages)\n"
+    + _SECTION_RULE
+    + "Issue: Hub packages missing integration tests\n"
+    "Pattern: tests/integration/hub_<package>.rs\n"
+    "Purpose: Lightweight sanity check that hub package is accessible\n"
+    "\n"
+    "{items}"
+    "\n"
+    "Fix: Create hub integration tests for each package:\n"
+    "  // tests/integration/hub_chrono.rs\n"
+    "  #[test]\n"
+    "  fn hub_chrono_available() {{\n"
+    "      use myproject::deps::chrono::Utc;\n"
+    "      let now = Utc::now();\n"
+    "      assert!(now.timestamp() > 0);\n"
+    "  }}\n"
+    "\n"
+)
+
+# Report sections in display order: (Violations field, section template,
+# per-entry template)
+_SECTIONS = (
+    ("naming", _NAMING_SECTION, "  {i:3d}. {entry}\n"),
+    (
+        "missing_sanity",
+        _SANITY_SECTION,
+        "  {i:3d}. Module '{entry}' (create: tests/sanity_{entry}.rs)\n",
+    ),
+    (
+        "missing_uat",
+        _UAT_SECTION,
+        "  {i:3d}. Module '{entry}' (create: tests/uat_{entry}.rs)\n",
+    ),
+    (
+        "missing_category_entries",
+        _CATEGORY_ENTRY_SECTION,
+        "  {i:3d}. Category '{entry}' (create: tests/{entry}.rs)\n",
+    ),
+    ("unauthorized_root", _UNAUTHORIZED_ROOT_SECTION, "  {i:3d}. {entry}\n"),
+    ("invalid_directories", _INVALID_DIRS_SECTION, "  {i:3d}. {entry}\n"),
+    (
+        "missing_hub_integration",
+        _HUB_SECTION,
+        "  {i:3d}. {entry}\n       Expected: tests/integration/hub_{entry}.rs\n",
+    ),
+)
+
+_SUMMARY_SECTION = (
+    "VIOLATION SUMMARY & FIXES\n"
+    "\n"
+    "Total Violations: {total}\n"
+    "• Naming issues: {naming}\n"
+    "• Missing sanity tests: {missing_sanity}\n"
+    "• Missing UAT tests: {missing_uat}\n"
+    "• Missing category entries: {missing_category_entries}\n"
+    "• Unauthorized root files: {unauthorized_root}\n"
+    "• Invalid directories: {invalid_directories}\n"
+    "• Missing hub integration tests: {missing_hub_integration}\n"
+    "\n"
+    "QUICK FIXES:\n"
+    "• Run 'testpy lint --violations' for detailed analysis\n"
+    "• Use 'testpy --override' for emergency bypass\n"
+    "• Follow naming pattern: <category>_<module>.rs\n"
+    "• Create missing sanity tests for all modules"
+)
+
+
+@dataclass(**_SLOTS)
 class Violations:
     """Categorized test organization violations."""
 
@@ -37,21 +219,25 @@ class Violations:
     # Missing hub integration tests: hub packages without integration tests
     missing_hub_integration: List[str] = field(default_factory=list)
 
-    def total(self) -> int:
-        """Get total violation count."""
+    def _lists(self) -> Tuple[List[str], ...]:
+        """Get the violation lists in report order."""
         return (
-            len(self.naming)
-            + len(self.missing_sanity)
-            + len(self.missing_uat)
-            + len(self.missing_category_entries)
-            + len(self.unauthorized_root)
-            + len(self.invalid_directories)
-            + len(self.missing_hub_integration)
+            self.naming,
+            self.missing_sanity,
+            self.missing_uat,
+            self.missing_category_entries,
+            self.unauthorized_root,
+            self.invalid_directories,
+            self.missing_hub_integration,
         )
 
+    def total(self) -> int:
+        """Get total violation count."""
+        return sum(map(len, self._lists()))
+
     def is_valid(self) -> bool:
-        """Check if there are no violations."""
-        return self.total() == 0
+        """Check if there are no violations (stops at the first non-empty list)."""
+        return not any(self._lists())
 
 
 def validate_rust_tests(repo_root: Path, config: Config) -> Violations:
@@ -74,126 +260,143 @@ def validate_rust_tests(repo_root: Path, config: Config) -> Violations:
     """
     violations = Violations()
 
-    # Discover modules and tests
-    modules = discover_rust_modules(repo_root, config)
-    tests = discover_rust_tests(repo_root, config)
-
-    # Valid categories
-    valid_categories = {
-        "sanity",
-        "smoke",
-        "unit",
-        "integration",
-        "e2e",
-        "uat",
-        "chaos",
-        "bench",
-        "regression",
-    }
-
-    # Required category entry files
-    required_category_entries = list(valid_categories)
+    # Filesystem work below uses plain strings; Path stays at the API boundary
+    repo_root_str = os.fspath(repo_root)
+    test_dir_str = os.path.normpath(os.path.join(repo_root_str, config.test_root))
 
-    test_dir = repo_root / config.test_root
+    # Read tests/ once; Checks 1, 4, 5 and 6 share the classified entries
+    rs_files, sh_files, subdirs = _scan_test_dir(test_dir_str)
 
-    # Check 1: Naming violations (tests/*.rs files with wrong pattern)
-    if test_dir.exists():
-        for test_file in test_dir.glob("*.rs"):
-            basename = test_file.stem
+    # Discover modules and index tests
+    modules = discover_rust_modules(repo_root, config)
+    test_index = _discover_test_index(repo_root, config, subdirs, rs_files)
+
+    # Reported paths are relative to repo_root; entries all sit directly in
+    # tests/, so the relative prefix is computed once and joined per name
+    root_prefix = repo_root_str + os.sep
+    if test_dir_str.startswith(root_prefix):
+        rel_prefix = test_dir_str[len(root_prefix):] + os.sep
+    else:
+        rel_prefix = os.path.join(os.path.relpath(test_dir_str, repo_root_str), "")
+        if rel_prefix == os.curdir + os.sep:
+            rel_prefix = ""
+
+    # Checks 1 & 5: Naming violations and unauthorized root files
+    # (tests/*.rs can violate both; tests/*.sh only Check 5)
+    is_category = VALID_CATEGORIES.__contains__
+    is_category_module = _CATEGORY_MODULE_RE.match
+    for test_file in chain(rs_files, sh_files):
+        # Both .rs and .sh are three characters; slice instead of splitext
+        basename = test_file.name[:-3]
+
+        # Skip excluded patterns
+        if basename.startswith(_EXCLUDED_PREFIXES):
+            continue
+
+        # Check if it's a valid category entry
+        if is_category(basename):
+            continue
+
+        # Check if it matches <category>_<module> pattern
+        if is_category_module(basename):
+            continue
+
+        rel_path = rel_prefix + test_file.name
+        if test_file.name.endswith(".rs"):
+            violations.naming.append(rel_path)
+        violations.unauthorized_root.append(rel_path)
+
+    # The index's (category, module) pairs cover all 3 patterns for
+    # Checks 2 & 3; its category entries answer Check 4
+    test_pairs = test_index.by_pair
+    category_entries_found = test_index.entries
+
+    # Checks 2 & 3: Missing sanity / UAT tests per module
+    for module in modules:
+        if ("sanity", module.name) not in test_pairs:
+            violations.missing_sanity.append(module.name)
+        if ("uat", module.name) not in test_pairs:
+            violations.missing_uat.append(module.name)
 
-            # Skip excluded patterns
-            if basename.startswith("_") or basename.startswith("dev_"):
-                continue
+    # Check 4: Missing category entry files
 
-            # Check if it's a valid category entry
-            if basename in valid_categories:
-                continue
+    # .sh entries count too; answered from the tests/ snapshot, not stat
+    sh_basenames = {entry.name[:-3] for entry in sh_files}
 
-            # Check if it matches <category>_<module> pattern
-            parts = basename.split("_", 1)
-            if len(parts) != 2:
-                violations.naming.append(str(test_file.relative_to(repo_root)))
-                continue
+    for category in REQUIRED_CATEGORY_ENTRIES:
+        if category not in category_entries_found and category not in sh_basenames:
+            violations.missing_category_entries.append(category)
 
-            category, module = parts
-            if category not in valid_categories:
-                violations.naming.append(str(test_file.relative_to(repo_root)))
+    # Check 6: Invalid test directories
+    for subdir in subdirs:
+        # Valid directories: categories, sh, _archive, _adhoc
+        if subdir.name not in VALID_DIRS:
+            violations.invalid_directories.append(rel_prefix + subdir.name)
 
-    # Check 2: Missing sanity tests per module
-    for module in modules:
-        # Check for sanity test in any of the 3 patterns
-        has_sanity = any(
-            t.category == "sanity" and t.module == module.name for t in tests
-        )
+    # Validation 6: Check for hub integration tests (optional)
+    violations.missing_hub_integration = validate_hub_integration_tests(repo_root)
 
-        if not has_sanity:
-            violations.missing_sanity.append(module.name)
+    return violations
 
-    # Check 3: Missing UAT tests per module
-    for module in modules:
-        # Check for UAT test in any of the 3 patterns
-        has_uat = any(t.category == "uat" and t.module == module.name for t in tests)
 
-        if not has_uat:
-            violations.missing_uat.append(module.name)
+def _scan_test_dir(test_dir: str) -> Tuple[List[os.DirEntry], List[os.DirEntry], List[os.DirEntry]]:
+    """
+    Classify the entries of the test root with a single directory read.
 
-    # Check 4: Missing category entry files
-    category_entries_found = {t.category for t in tests if t.is_category_entry}
-
-    for category in required_category_entries:
-        if category not in category_entries_found:
-            # Also check if .sh version exists
-            sh_file = test_dir / f"{category}.sh"
-            if not sh_file.exists():
-                violations.missing_category_entries.append(category)
-
-    # Check 5: Unauthorized root files (tests/*.rs or tests/*.sh not matching rules)
-    if test_dir.exists():
-        for test_file in list(test_dir.glob("*.rs")) + list(test_dir.glob("*.sh")):
-            basename = test_file.stem
-
-            # Skip excluded patterns
-            if basename.startswith("_") or basename.startswith("dev_"):
-                continue
-
-            # Check if it's a category entry
-            if basename in valid_categories:
-                continue
-
-            # Check if it's a valid <category>_<module> pattern
-            parts = basename.split("_", 1)
-            is_valid = False
-
-            if len(parts) == 2:
-                category, module = parts
-                if category in valid_categories:
-                    is_valid = True
-
-            if not is_valid:
-                violations.unauthorized_root.append(
-                    str(test_file.relative_to(repo_root))
-                )
+    Args:
+        test_dir: Test root directory (e.g. tests/)
 
-    # Check 6: Invalid test directories
-    if test_dir.exists():
-        for subdir in test_dir.iterdir():
-            if not subdir.is_dir():
-                continue
+    Returns:
+        Tuple of (.rs files, .sh files, subdirectories); all empty if
+        test_dir doesn't exist
+    """
+    rs_files = []
+    sh_files = []
+    subdirs = []
 
-            dir_name = subdir.name
+    try:
+        with os.scandir(test_dir) as it:
+            for entry in it:
+                name = entry.name
+                if entry.is_dir():
+                    subdirs.append(entry)
+                elif name.endswith(_ROOT_SUFFIXES) and entry.is_file():
+                    if name.endswith(".rs"):
+                        rs_files.append(entry)
+                    else:
+                        sh_files.append(entry)
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+
+    return rs_files, sh_files, subdirs
+
+
+def _discover_test_index(
+    repo_root: Path,
+    config: Config,
+    subdirs: List[os.DirEntry],
+    rs_files: List[os.DirEntry],
+) -> TestIndex:
+    """
+    Discover and index Rust tests.
 
-            # Valid directories: categories, sh, _archive, _adhoc
-            valid_dirs = valid_categories | {"sh", "_archive", "_adhoc"}
+    Discovery only finds root .rs files and files in category directories,
+    so when the tests/ scan has neither (including a missing tests/) the
+    discovery pass is skipped.
 
-            if dir_name not in valid_dirs:
-                violations.invalid_directories.append(
-                    str(subdir.relative_to(repo_root))
-                )
+    Args:
+        repo_root: Repository root directory
+        config: Configuration with test_root
+        subdirs: Subdirectories of the test root (from _scan_test_dir)
+        rs_files: Root .rs files of the test root (from _scan_test_dir)
 
-    # Validation 6: Check for hub integration tests (optional)
-    violations.missing_hub_integration = validate_hub_integration_tests(repo_root)
+    Returns:
+        TestIndex over the discovered test files
+    """
+    if not rs_files and not any(entry.name in VALID_CATEGORIES for entry in subdirs):
+        return TestIndex()
 
-    return violations
+    return build_test_index(discover_rust_tests(repo_root, config))
 
 
 def get_violation_summary(violations: Violations) -> Dict[str, int]:
@@ -206,7 +409,7 @@ def get_violation_summary(violations: Violations) -> Dict[str, int]:
     Returns:
         Dict mapping violation type to count
     """
-    return {
+    summary = {
         "naming": len(violations.naming),
         "missing_sanity": len(violations.missing_sanity),
         "missing_uat": len(violations.missing_uat),
@@ -214,8 +417,28 @@ def get_violation_summary(violations: Violations) -> Dict[str, int]:
         "unauthorized_root": len(violations.unauthorized_root),
         "invalid_directories": len(violations.invalid_directories),
         "missing_hub_integration": len(violations.missing_hub_integration),
-        "total": violations.total(),
     }
+    summary["total"] = sum(summary.values())
+    return summary
+
+
+def _format_section(section: str, item: str, count: int, entries: List[str]) -> str:
+    """
+    Render one report section with its numbered entries.
+
+    Args:
+        section: Section template with {count} and {items}
+        item: Per-entry template with {i} (1-based index) and {entry}
+        count: Number of entries shown in the header
+        entries: Violation entries for the section
+
+    Returns:
+        Formatted section string
+    """
+    return section.format(
+        count=count,
+        items="".join(item.format(i=i, entry=entry) for i, entry in enumerate(entries, 1)),
+    )
 
 
 def format_violation_report(violations: Violations, repo_root: Path) -> str:
@@ -229,159 +452,23 @@ def format_violation_report(violations: Violations, repo_root: Path) -> str:
     Returns:
         Formatted report string
     """
-    lines = []
-
-    lines.append(f"📋 Test Organization Violations Report ({violations.total()} total)")
-    lines.append("=" * 80)
-    lines.append("")
-
-    # Naming violations
-    if violations.naming:
-        lines.append(f"🏷️  NAMING VIOLATIONS ({len(violations.naming)} files)")
-        lines.append("-" * 80)
-        lines.append("Issue: Test wrapper files don't follow naming pattern")
-        lines.append(
-            "Required: <category>_<module>.rs (e.g., sanity_com.rs, uat_math.rs)"
-        )
-        lines.append(
-            "Valid categories: unit, sanity, smoke, integration, e2e, uat, chaos, bench"
-        )
-        lines.append("")
-        for i, file in enumerate(violations.naming, 1):
-            lines.append(f"  {i:3d}. {file}")
-        lines.append("")
-        lines.append(
-            "Fix: Rename files to match pattern (e.g., com_sanity.rs → sanity_com.rs)"
-        )
-        lines.append("")
+    # Count each category once; headers and the summary share these
+    summary = get_violation_summary(violations)
 
-    # Missing sanity tests
-    if violations.missing_sanity:
-        lines.append(
-            f"🚨 MISSING SANITY TESTS ({len(violations.missing_sanity)} modules)"
-        )
-        lines.append("-" * 80)
-        lines.append("Issue: Modules without required sanity tests")
-        lines.append("Required: Every module must have sanity tests for core functionality")
-        lines.append("")
-        for i, module in enumerate(violations.missing_sanity, 1):
-            lines.append(f"  {i:3d}. Module '{module}' (create: tests/sanity_{module}.rs)")
-        lines.append("")
-        lines.append("Fix: Create sanity test files for each module")
-        lines.append("")
-
-    # Missing UAT tests
-    if violations.missing_uat:
-        lines.append(f"🎭 MISSING UAT TESTS ({len(violations.missing_uat)} modules)")
-        lines.append("-" * 80)
-        lines.append("Issue: Modules without required visual UAT/ceremony tests")
-        lines.append(
-            "Required: Every module must have UAT tests for visual demonstrations"
-        )
-        lines.append("")
-        for i, module in enumerate(violations.missing_uat, 1):
-            lines.append(f"  {i:3d}. Module '{module}' (create: tests/uat_{module}.rs)")
-        lines.append("")
-        lines.append("Fix: Create UAT test files with visual demonstrations for each module")
-        lines.append("")
-
-    # Missing category entries
-    if violations.missing_category_entries:
-        lines.append(
-            f"📋 MISSING CATEGORY ENTRY FILES ({len(violations.missing_category_entries)} categories)"
-        )
-        lines.append("-" * 80)
-        lines.append("Issue: Missing category-level test orchestrators")
-        lines.append(
-            "Required: Each category needs an entry file (e.g., smoke.rs, unit.rs)"
-        )
-        lines.append("")
-        for i, category in enumerate(violations.missing_category_entries, 1):
-            lines.append(f"  {i:3d}. Category '{category}' (create: tests/{category}.rs)")
-        lines.append("")
-        lines.append("Fix: Create category entry files for cross-module integration tests")
-        lines.append("")
-
-    # Unauthorized root files
-    if violations.unauthorized_root:
-        lines.append(
-            f"🚫 UNAUTHORIZED ROOT FILES ({len(violations.unauthorized_root)} files)"
-        )
-        lines.append("-" * 80)
-        lines.append("Issue: Files in tests/ root that don't follow organization rules")
-        lines.append("Allowed: <category>.rs or <category>_<module>.rs only")
-        lines.append("")
-        for i, file in enumerate(violations.unauthorized_root, 1):
-            lines.append(f"  {i:3d}. {file}")
-        lines.append("")
-        lines.append(
-            "Fix: Rename to pattern, move to tests/_adhoc/, or move to tests/_archive/"
-        )
-        lines.append("")
+    buf = io.StringIO()
+    write = buf.write
 
-    # Invalid directories
-    if violations.invalid_directories:
-        lines.append(
-            f"📁 INVALID DIRECTORIES ({len(violations.invalid_directories)} directories)"
-        )
-        lines.append("-" * 80)
-        lines.append("Issue: Test directories don't match approved organization")
-        lines.append(
-            "Valid: unit/, sanity/, smoke/, integration/, e2e/, uat/, chaos/, bench/, regression/, sh/, _archive/, _adhoc/"
-        )
-        lines.append("")
-        for i, dir_path in enumerate(violations.invalid_directories, 1):
-            lines.append(f"  {i:3d}. {dir_path}")
-        lines.append("")
-        lines.append(
-            "Fix: Move tests to approved category directories or rename to _archive/"
-        )
-        lines.append("")
+    write(_REPORT_HEADER.format(total=summary["total"]))
 
-    # Missing hub integration tests
-    if violations.missing_hub_integration:
-        lines.append(
-            f"🔌 MISSING HUB INTEGRATION TESTS ({len(violations.missing_hub_integration)} packages)"
-        )
-        lines.append("-" * 80)
-        lines.append("Issue: Hub packages missing integration tests")
-        lines.append("Pattern: tests/integration/hub_<package>.rs")
-        lines.append("Purpose: Lightweight sanity check that hub package is accessible")
-        lines.append("")
-        for i, package in enumerate(violations.missing_hub_integration, 1):
-            lines.append(f"  {i:3d}. {package}")
-            lines.append(f"       Expected: tests/integration/hub_{package}.rs")
-        lines.append("")
-        lines.append("Fix: Create hub integration tests for each package:")
-        lines.append("  // tests/integration/hub_chrono.rs")
-        lines.append("  #[test]")
-        lines.append("  fn hub_chrono_available() {")
-        lines.append("      use myproject::deps::chrono::Utc;")
-        lines.append("      let now = Utc::now();")
-        lines.append("      assert!(now.timestamp() > 0);")
-        lines.append("  }")
-        lines.append("")
+    for name, section, item in _SECTIONS:
+        entries = getattr(violations, name)
+        if entries:
+            write(_format_section(section, item, summary[name], entries))
 
     # Summary
-    summary = get_violation_summary(violations)
-    lines.append("VIOLATION SUMMARY & FIXES")
-    lines.append("")
-    lines.append(f"Total Violations: {summary['total']}")
-    lines.append(f"• Naming issues: {summary['naming']}")
-    lines.append(f"• Missing sanity tests: {summary['missing_sanity']}")
-    lines.append(f"• Missing UAT tests: {summary['missing_uat']}")
-    lines.append(f"• Missing category entries: {summary['missing_category_entries']}")
-    lines.append(f"• Unauthorized root files: {summary['unauthorized_root']}")
-    lines.append(f"• Invalid directories: {summary['invalid_directories']}")
-    lines.append(f"• Missing hub integration tests: {summary['missing_hub_integration']}")
-    lines.append("")
-    lines.append("QUICK FIXES:")
-    lines.append("• Run 'testpy lint --violations' for detailed analysis")
-    lines.append("• Use 'testpy --override' for emergency bypass")
-    lines.append("• Follow naming pattern: <category>_<module>.rs")
-    lines.append("• Create missing sanity tests for all modules")
-
-    return "\n".join(lines)
+    write(_SUMMARY_SECTION.format(**summary))
+
+    return buf.getvalue()
 
 
 def get_hub_packages() -> List[str]:
@@ -389,48 +476,82 @@ def get_hub_packages() -> List[str]:
     Get list of hub packages from blade cache.
 
     Parses ~/.local/data/snek/blade/deps_cache.tsv to extract
-    packages from the hub repo (dependency reexports).
+    packages from the hub repo (dependency reexports). Parsed results are
+    memoized per cache file mtime, so repeat calls cost a single stat.
 
     Returns:
         List of hub package names (e.g., ["chrono", "serde", "regex"])
         Empty list if blade cache not found or hub repo not detected
     """
-    cache_file = Path.home() / ".local/data/snek/blade/deps_cache.tsv"
+    cache_file = str(Path.home() / ".local/data/snek/blade/deps_cache.tsv")
 
-    if not cache_file.exists():
+    try:
+        mtime_ns = os.stat(cache_file).st_mtime_ns
+    except OSError:
         return []  # Blade cache not generated yet
 
-    packages = []
-    hub_repo_id = None
+    return list(_get_hub_packages_cached(cache_file, mtime_ns))
 
-    try:
-        with open(cache_file, "r") as f:
-            for line in f:
-                parts = line.strip().split("\t")
 
-                if len(parts) < 2:
-                    continue
+@functools.lru_cache(maxsize=16)
+def _get_hub_packages_cached(cache_file: str, mtime_ns: int) -> Tuple[str, ...]:
+    """
+    Parse hub packages from the blade cache (memoized on path and mtime).
 
-                # Find hub repo line: has "hub" name and "Cargo.toml" in path
-                if parts[1] == "hub" and "Cargo.toml" in line:
-                    hub_repo_id = parts[0]
-                    continue
+    Args:
+        cache_file: Path to deps_cache.tsv
+        mtime_ns: Modification time of cache_file, used as cache key
+
+    Returns:
+        Sorted tuple of hub package names
+    """
+    packages = set()
+    hub_repo_id = None
+
+    try:
+        with open(cache_file, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return ()  # mmap cannot map an empty file
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Jump to the hub repo line: <id> hub <path/Cargo.toml>
+                # (memchr-speed scan; rows before the hub block are never decoded)
+                pos = 0
+                while hub_repo_id is None:
+                    idx = mm.find(b"\thub\t", pos)
+                    if idx == -1:
+                        return ()  # Hub repo not in cache
+
+                    start = mm.rfind(b"\n", 0, idx) + 1
+                    end = mm.find(b"\n", idx)
+                    if end == -1:
+                        end = len(mm)
+
+                    # "\thub\t" may also be a later column; require the name column
+                    parts = mm[start:end].decode().strip().split("\t", 2)
+                    if len(parts) == 3 and parts[1] == "hub" and "Cargo.toml" in parts[2]:
+                        hub_repo_id = parts[0]
+                    pos = end
+
+                # Collect hub dependencies: <id> <repo_id> <package> <version> ...
+                mm.seek(pos)
+                for line in iter(mm.readline, b""):
+                    parts = line.decode().strip().split("\t", 3)
+                    if len(parts) < 2:
+                        continue
 
-                # If we found hub repo, collect its dependencies
-                if hub_repo_id and parts[0].startswith(hub_repo_id):
-                    # Dependency lines: <id> <repo_id> <package> <version> ...
-                    if len(parts) >= 3 and parts[0] != hub_repo_id:
-                        package_name = parts[2]
-                        packages.append(package_name)
                     # Stop when we hit next repo (different prefix)
-                    elif not parts[0].startswith(hub_repo_id):
+                    if not parts[0].startswith(hub_repo_id):
                         break
 
+                    if len(parts) >= 3 and parts[0] != hub_repo_id:
+                        packages.add(parts[2])
+
     except Exception:
         # Silently fail - hub validation is optional
-        return []
+        return ()
 
-    return sorted(set(packages))
+    return tuple(sorted(packages))
 
 
 def has_hub_usage(repo_root: Path) -> bool:
@@ -443,8 +564,7 @@ def has_hub_usage(repo_root: Path) -> bool:
     Returns:
         True if repo has src/deps.rs (hub usage indicator)
     """
-    deps_file = repo_root / "src" / "deps.rs"
-    return deps_file.exists()
+    return os.path.exists(os.path.join(repo_root, "src", "deps.rs"))
 
 
 def validate_hub_integration_tests(repo_root: Path) -> List[str]:
@@ -469,13 +589,15 @@ def validate_hub_integration_tests(repo_root: Path) -> List[str]:
     if not hub_packages:
         return []  # No hub packages found or blade cache unavailable
 
-    missing = []
-    integration_dir = repo_root / "tests" / "integration"
+    integration_dir = os.path.join(repo_root, "tests", "integration")
 
-    for package in hub_packages:
-        # Expected test file: tests/integration/hub_<package>.rs
-        test_file = integration_dir / f"hub_{package}.rs"
-        if not test_file.exists():
-            missing.append(package)
+    # One readdir instead of a stat per package; a missing integration/
+    # directory means every hub package is missing its test
+    try:
+        with os.scandir(integration_dir) as it:
+            existing = {entry.name for entry in it if entry.is_file()}
+    except (FileNotFoundError, NotADirectoryError):
+        existing = set()
 
-    return missing
+    # Expected test file: tests/integration/hub_<package>.rs
+    return [package for package in hub_packages if f"hub_{package}.rs" not in existing]